@@ -1,27 +1,26 @@
 import datetime
 import threading
+import asyncio
+import heapq
+import itertools
 import calendar
 import json
+import csv
 import random
 import os
 import time
+import collections
+import concurrent.futures
+import functools
+import importlib
+import urllib.parse
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog
 import customtkinter as ctk
 from PIL import Image, ImageTk, ImageDraw
-import schedule
-import pytz
-from textblob import TextBlob
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from dateutil.relativedelta import relativedelta
-import pandas as pd
 import keyring
-import tweepy
-from facebook import GraphAPI
-from TikTokApi import TikTokApi
-from linkedin_api import Linkedin
 
 PLATFORMS = ["Facebook", "Instagram", "X (Twitter)", "LinkedIn", "TikTok", "Snapchat"]
 MEDIA_TEMP = Path.home() / ".socialpilot_media"
@@ -33,9 +32,48 @@ API_KEYS = {
     "snapchat": ("AD_ACCOUNT_ID", "CLIENT_SECRET")
 }
 CATEGORIES = {
-    "Documents": [".pdf", ".docx", ".txt", ".xlsx", ".pptx"],
-    "Images": [".jpg", ".png", ".webp", ".gif", ".svg"]
+    "Documents": frozenset({".pdf", ".docx", ".txt", ".xlsx", ".pptx"}),
+    "Images": frozenset({".jpg", ".png", ".webp", ".gif", ".svg"})
 }
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+_MEDIA_PLATFORMS = frozenset({"Facebook", "X (Twitter)", "Instagram", "LinkedIn"})
+CHAR_LIMITS = {
+    "Facebook": 2200,
+    "X (Twitter)": 280,
+    "LinkedIn": 3000,
+    "TikTok": 150,
+    "Snapchat": 100
+}
+DEFAULT_CHAR_LIMIT = 2000
+_DEFAULT_HASHTAGS = tuple(
+    f"#{kw}" for kw in ("socialmedia", "marketing", "tech", "business", "innovation")
+)
+_HASHTAG_CACHE = {n: " ".join(_DEFAULT_HASHTAGS[:n]) for n in range(len(_DEFAULT_HASHTAGS) + 1)}
+USE_TEXTBLOB = False  # Legacy sentiment backend, requires textblob
+FB_BATCH_SIZE = 50  # Graph API cap on requests per batch call
+PUBLISH_CONCURRENCY = 8  # In-flight publish requests per platform
+SCHEDULER_MAX_WAIT = 3600  # Seconds; far-off deadlines are re-checked rather than overflowing wait()
+
+@functools.lru_cache(maxsize=None)
+def _get_password(service, key):
+    """Read a secret from the OS keyring, cached until the next save"""
+    return keyring.get_password(service, key)
+
+@functools.lru_cache(maxsize=None)
+def _vader():
+    """Build the VADER analyzer on first use"""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+@functools.lru_cache(maxsize=None)
+def _blobber():
+    """Build a reusable TextBlob factory on first use, or None if textblob isn't installed"""
+    try:
+        from textblob import Blobber
+        from textblob.sentiments import PatternAnalyzer
+    except ImportError:
+        return None
+    return Blobber(analyzer=PatternAnalyzer())
 
 class SocialMediaManager:
     """Handles all social media operations and data management"""
@@ -44,6 +82,14 @@ class SocialMediaManager:
         self.scheduled_posts = []
         self.comments = []
         self.clients = {}
+        self._posts_by_day = collections.defaultdict(list)
+        self._heap = []
+        self._cv = threading.Condition()
+        self._seq = itertools.count()
+        self._semaphores = {}
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._load_credentials()
         self._setup_temp_storage()
         self._start_scheduler()
 
@@ -53,33 +99,44 @@ class SocialMediaManager:
 
     def _load_credentials(self):
         """Load API credentials from secure storage"""
-        self.credentials = {}
-        for platform in PLATFORMS:
-            keys = API_KEYS.get(platform.lower(), [])
-            self.credentials[platform] = {
-                key: keyring.get_password(f"socialpilot_{platform}", key)
-                for key in keys
-            }
+        self.credentials = {
+            platform: {key: _get_password(f"socialpilot_{platform}", key) for key in keys}
+            for platform, keys in API_KEYS.items()
+        }
 
     def _setup_clients(self):
-        """Initialize API clients for all platforms"""
-        self.clients = {
-            "Facebook": GraphAPI(
-                access_token=self.credentials["Facebook"]["APP_ID"]
-            ) if self.credentials["Facebook"]["APP_ID"] else None,
-            "X (Twitter)": tweepy.Client(
-                consumer_key=self.credentials["X (Twitter)"]["API_KEY"],
-                consumer_secret=self.credentials["X (Twitter)"]["API_SECRET"]
-            ) if self.credentials["X (Twitter)"]["API_KEY"] else None,
-            "LinkedIn": Linkedin(
-                username=self.credentials["LinkedIn"]["CLIENT_ID"],
-                password=self.credentials["LinkedIn"]["CLIENT_SECRET"]
-            ) if self.credentials["LinkedIn"]["CLIENT_ID"] else None,
-            "TikTok": TikTokApi().get_instance(
-                custom_verifyFp=self.credentials["TikTok"]["ACCESS_TOKEN"]
-            ) if self.credentials["TikTok"]["ACCESS_TOKEN"] else None
+        """Initialize API clients for all platforms concurrently"""
+        creds = self.credentials
+        builders = {
+            "Facebook": lambda: importlib.import_module("facebook").GraphAPI(
+                access_token=creds["facebook"]["APP_ID"]
+            ) if creds["facebook"]["APP_ID"] else None,
+            "X (Twitter)": lambda: importlib.import_module("tweepy").Client(
+                consumer_key=creds["twitter"]["API_KEY"],
+                consumer_secret=creds["twitter"]["API_SECRET"]
+            ) if creds["twitter"]["API_KEY"] else None,
+            "LinkedIn": lambda: importlib.import_module("linkedin_api").Linkedin(
+                username=creds["linkedin"]["CLIENT_ID"],
+                password=creds["linkedin"]["CLIENT_SECRET"]
+            ) if creds["linkedin"]["CLIENT_ID"] else None
         }
 
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            futures = {
+                name: executor.submit(self._build_client, name, ctor)
+                for name, ctor in builders.items()
+            }
+        self.clients = {name: future.result() for name, future in futures.items()}
+
+    @staticmethod
+    def _build_client(name, ctor):
+        """Construct one client, returning None so a bad credential can't fail the rest"""
+        try:
+            return ctor()
+        except Exception as e:
+            print(f"{name} client setup error: {str(e)}")
+            return None
+
     def setup_credentials(self):
         """Load credentials and setup clients"""
         self._load_credentials()
@@ -92,23 +149,21 @@ class SocialMediaManager:
             "platform": platform,
             "content": self._process_content(platform, content),
             "media": self._process_media(platform, media_path),
-            "scheduled_time": schedule_time or datetime.datetime.now(),
+            "scheduled_time": (schedule_time or datetime.datetime.now()).astimezone(datetime.timezone.utc),
             "status": "Queued"
         }
+        post["deadline"] = post["scheduled_time"].timestamp()
         self.scheduled_posts.append(post)
+        local_time = post["scheduled_time"].astimezone()
+        self._posts_by_day[(local_time.year, local_time.month, local_time.day)].append(post)
+        with self._cv:
+            heapq.heappush(self._heap, (post["deadline"], next(self._seq), post))
+            self._cv.notify()
         return post
 
     def _process_content(self, platform, text):
         """Apply platform-specific formatting rules"""
-        char_limit = {
-            "Facebook": 2200,
-            "X (Twitter)": 280,
-            "LinkedIn": 3000,
-            "TikTok": 150,
-            "Snapchat": 100
-        }.get(platform, 2000)
-        
-        return text[:char_limit] + " " + self._generate_hashtags(text)
+        return text[:CHAR_LIMITS.get(platform, DEFAULT_CHAR_LIMIT)] + " " + self._generate_hashtags(text)
 
     def _process_media(self, platform, media_path):
         """Handle image processing only"""
@@ -116,7 +171,7 @@ class SocialMediaManager:
             return None
             
         try:
-            if media_path.suffix.lower() in [".jpg", ".png"]:
+            if media_path.suffix.lower() in _IMAGE_EXTS:
                 return self._process_image(platform, media_path)
             return None
         except Exception as e:
@@ -125,21 +180,112 @@ class SocialMediaManager:
 
     def _generate_hashtags(self, text, n=5):
         """Generate AI-powered hashtag suggestions"""
-        keywords = ["socialmedia", "marketing", "tech", "business", "innovation"]
-        return " ".join(f"#{kw}" for kw in keywords[:n])
+        return _HASHTAG_CACHE.get(n) or " ".join(_DEFAULT_HASHTAGS[:n])
 
     def _start_scheduler(self):
-        """Background task to check scheduled posts"""
+        """Background task to publish posts as they come due"""
         def scheduler_loop():
             while True:
-                now = datetime.datetime.now(pytz.utc)
-                for post in self.scheduled_posts:
-                    if post["status"] == "Queued" and post["scheduled_time"] <= now:
-                        self._publish_post(post)
-                time.sleep(60)
+                with self._cv:
+                    while not self._heap:
+                        self._cv.wait()
+                    now_ts = time.time()
+                    delta = self._heap[0][0] - now_ts
+                    if delta > 0:
+                        # Woken early by schedule_post if a sooner post arrives
+                        self._cv.wait(timeout=min(delta, SCHEDULER_MAX_WAIT))
+                        continue
+                    due = collections.defaultdict(list)
+                    while self._heap and self._heap[0][0] <= now_ts:
+                        _, _, post = heapq.heappop(self._heap)
+                        if post["status"] == "Queued":
+                            due[post["platform"]].append(post)
+                self._publish_batch(due)
         
         threading.Thread(target=scheduler_loop, daemon=True).start()
 
+    def _publish_batch(self, posts_by_platform):
+        """Hand due posts to the publishing event loop without blocking the scheduler"""
+        future = asyncio.run_coroutine_threadsafe(self._publish_async(posts_by_platform), self._loop)
+        future.add_done_callback(functools.partial(self._on_publish_done, posts_by_platform))
+
+    def _on_publish_done(self, posts_by_platform, future):
+        """Fail any posts left queued if the publishing run itself errored"""
+        error = "Publishing cancelled" if future.cancelled() else future.exception()
+        if error:
+            for posts in posts_by_platform.values():
+                self._fail_posts(posts, error)
+
+    @staticmethod
+    def _fail_posts(posts, error):
+        """Mark posts that never got a result as failed"""
+        print(f"Publishing error: {str(error)}")
+        for post in posts:
+            if post["status"] == "Queued":
+                post["status"] = f"Failed: {str(error)}"
+
+    async def _publish_async(self, posts_by_platform):
+        """Publish all due posts concurrently, one dispatch per platform"""
+        jobs = []
+        for platform, posts in posts_by_platform.items():
+            if platform == "Facebook" and self.clients.get(platform):
+                for i in range(0, len(posts), FB_BATCH_SIZE):
+                    chunk = posts[i:i + FB_BATCH_SIZE]
+                    jobs.append((platform, self._publish_facebook_batch, chunk, chunk))
+            else:
+                # No batch endpoint (tweepy etc.), so overlap the round-trips
+                jobs.extend((platform, self._publish_post, post, [post]) for post in posts)
+
+        results = await asyncio.gather(
+            *(self._run_limited(platform, func, arg) for platform, func, arg, _ in jobs),
+            return_exceptions=True
+        )
+        for (_, _, _, posts), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                self._fail_posts(posts, result)
+
+    async def _run_limited(self, platform, func, arg):
+        """Run a blocking SDK call in the executor under the platform's rate limit"""
+        semaphore = self._semaphores.get(platform)
+        if semaphore is None:
+            semaphore = self._semaphores[platform] = asyncio.Semaphore(PUBLISH_CONCURRENCY)
+        async with semaphore:
+            await self._loop.run_in_executor(None, func, arg)
+
+    def _publish_facebook_batch(self, posts):
+        """Send up to FB_BATCH_SIZE feed posts in a single Graph batch request"""
+        requests = []
+        for post in posts:
+            body = {"message": post["content"]}
+            if post["media"]:
+                body["attached_media"] = json.dumps([post["media"]])
+            requests.append({
+                "method": "POST",
+                "relative_url": "me/feed",
+                "body": urllib.parse.urlencode(body)
+            })
+
+        try:
+            client = self.clients["Facebook"]
+            responses = client.request(
+                client.version, post_args={"batch": json.dumps(requests)}
+            )
+        except Exception as e:
+            for post in posts:
+                post["status"] = f"Failed: {str(e)}"
+            return
+
+        # Graph returns one entry per request, or null for requests it didn't run
+        if not isinstance(responses, list):
+            responses = []
+        for post, response in itertools.zip_longest(posts, responses[:len(posts)]):
+            if not isinstance(response, dict):
+                post["status"] = "Failed: No response"
+            elif response.get("code") == 200:
+                post["status"] = "Published"
+            else:
+                post["status"] = f"Failed: {response.get('body') or response.get('code')}"
+
     def _publish_post(self, post):
         """Execute platform-specific posting"""
         try:
@@ -148,34 +294,48 @@ class SocialMediaManager:
                 raise Exception("Client not configured")
 
             if post["platform"] == "X (Twitter)":
-                client.create_tweet(
-                    text=post["content"],
-                    media_ids=[self._upload_media(post["platform"], post["media"])]
-                )
+                # No media upload path for X yet, so tweets are text-only
+                client.create_tweet(text=post["content"])
             elif post["platform"] == "Facebook":
+                media = {"attached_media": [post["media"]]} if post["media"] else {}
                 client.put_object(
                     parent_object="me",
                     connection_name="feed",
                     message=post["content"],
-                    attached_media=[post["media"]]
+                    **media
                 )
             post["status"] = "Published"
         except Exception as e:
             post["status"] = f"Failed: {str(e)}"
 
-    def get_scheduled_posts(self, month=None):
-        """Get posts filtered by month"""
-        if not month:
-            month = datetime.datetime.now().month
-        return [p for p in self.scheduled_posts 
-                if p['scheduled_time'].month == month]
-
-    def analyze_sentiment(self, text):
-        """Perform sentiment analysis using TextBlob"""
-        analysis = TextBlob(text)
-        if analysis.sentiment.polarity > 0.1:
+    def get_scheduled_posts(self, month=None, year=None):
+        """Get posts filtered by local calendar month"""
+        today = datetime.date.today()
+        month, year = month or today.month, year or today.year
+        return [p for (y, m, _), posts in self._posts_by_day.items()
+                if (y, m) == (year, month) for p in posts]
+
+    def get_posts_for_day(self, year, month, day):
+        """Get posts scheduled on a given local calendar day"""
+        return self._posts_by_day.get((year, month, day), [])
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def analyze_sentiment(text):
+        """Perform sentiment analysis using VADER (or TextBlob if USE_TEXTBLOB)"""
+        blobber = _blobber() if USE_TEXTBLOB else None
+        if blobber is not None:
+            polarity = blobber(text).sentiment.polarity
+            if polarity > 0.1:
+                return "positive"
+            elif polarity < -0.1:
+                return "negative"
+            return "neutral"
+
+        compound = _vader().polarity_scores(text)["compound"]
+        if compound >= 0.05:
             return "positive"
-        elif analysis.sentiment.polarity < -0.1:
+        elif compound <= -0.05:
             return "negative"
         return "neutral"
 
@@ -186,6 +346,7 @@ class SocialPilotApp(ctk.CTk):
         super().__init__()
         self.manager = SocialMediaManager()
         self.current_month = datetime.datetime.now()
+        self._pending_redraws = {}
         
         self.title("SocialPilot Pro 🚀")
         self.geometry("1400x900")
@@ -222,6 +383,7 @@ class SocialPilotApp(ctk.CTk):
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         self.credential_entries = {}
+        self._cred_snapshot = {}  # (platform, key) -> value last known to be in the keyring
         for platform, keys in API_KEYS.items():
             frame = ctk.CTkFrame(main_frame)
             frame.pack(fill="x", pady=10)
@@ -238,9 +400,10 @@ class SocialPilotApp(ctk.CTk):
                 entry = ctk.CTkEntry(key_frame, show="*")
                 entry.pack(side="right", expand=True, fill="x", padx=5)
                 
-                saved_value = keyring.get_password(f"socialpilot_{platform}", key)
+                saved_value = self.manager.credentials[platform][key]
                 if saved_value:
                     entry.insert(0, saved_value)
+                    self._cred_snapshot[(platform, key)] = saved_value
                     
                 self.credential_entries[platform][key] = entry
         
@@ -254,13 +417,22 @@ class SocialPilotApp(ctk.CTk):
 
     def _save_credentials(self):
         """Save and apply new credentials"""
+        changed = False
         for platform, keys in self.credential_entries.items():
             for key, entry in keys.items():
                 value = entry.get().strip()
-                if value:
+                if value and self._cred_snapshot.get((platform, key)) != value:
                     keyring.set_password(f"socialpilot_{platform}", key, value)
+                    self._cred_snapshot[(platform, key)] = value
+                    changed = True
         
-        if self.manager.setup_credentials():
+        if changed or not self.manager.clients:
+            _get_password.cache_clear()
+            connected = self.manager.setup_credentials()
+        else:
+            connected = any(self.manager.clients.values())
+
+        if connected:
             self.status_label.configure(
                 text="Status: Connected successfully",
                 text_color="green")
@@ -291,11 +463,12 @@ class SocialPilotApp(ctk.CTk):
         control_frame = ctk.CTkFrame(self.schedule_frame)
         control_frame.pack(fill="x", padx=20, pady=10)
         
-        ctk.CTkButton(
+        self.media_button = ctk.CTkButton(
             control_frame,
             text="📁 Add Media",
             command=self._upload_media
-        ).pack(side="left", padx=5)
+        )
+        self.media_button.pack(side="left", padx=5)
 
         schedule_control_frame = ctk.CTkFrame(control_frame)
         schedule_control_frame.pack(side="right", padx=5)
@@ -343,6 +516,30 @@ class SocialPilotApp(ctk.CTk):
 
         self.grid_frame = ctk.CTkFrame(self.calendar_frame)
         self.grid_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        days = ["Sat", "Sun","Mon", "Tue", "Wed", "Thu", "Fri"]
+        for col, day in enumerate(days):
+            ctk.CTkLabel(self.grid_frame, text=day, width=100, height=30).grid(
+                row=0, column=col, padx=2, pady=2
+            )
+
+        # Fixed 6x7 pool of day cells, relabelled on each redraw
+        self._cal_cells = []
+        for row in range(6):
+            week_cells = []
+            for col in range(7):
+                frame = ctk.CTkFrame(self.grid_frame, width=100, height=80)
+                frame.grid(row=row+1, column=col, padx=2, pady=2)
+                frame.grid_propagate(False)
+
+                day_lbl = ctk.CTkLabel(frame, text="")
+                day_lbl.pack()
+                count_lbl = ctk.CTkLabel(frame, text="", font=("Arial", 10))
+                count_lbl.pack()
+
+                week_cells.append({"frame": frame, "day_lbl": day_lbl, "count_lbl": count_lbl})
+            self._cal_cells.append(week_cells)
+
         self._draw_calendar()
 
     def _create_analytics_tab(self):
@@ -352,6 +549,7 @@ class SocialPilotApp(ctk.CTk):
         
         self.chart_canvas = ctk.CTkCanvas(sentiment_frame)
         self.chart_canvas.pack(fill="both", expand=True)
+        self._fig = self._ax = self._canvas = None  # Built on first analysis
         
         ctk.CTkButton(
             sentiment_frame,
@@ -377,41 +575,38 @@ class SocialPilotApp(ctk.CTk):
         self.config(menu=self.menu)
 
     def _draw_calendar(self):
-        """Draw calendar grid with posts"""
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
-            
-        days = ["Sat", "Sun","Mon", "Tue", "Wed", "Thu", "Fri"]
-        for col, day in enumerate(days):
-            ctk.CTkLabel(self.grid_frame, text=day, width=100, height=30).grid(
-                row=0, column=col, padx=2, pady=2
-            )
-            
-        cal = calendar.monthcalendar(self.current_month.year, self.current_month.month)
-        for week_num, week in enumerate(cal):
-            for day_num, day in enumerate(week):
+        """Update calendar grid with posts"""
+        year, month = self.current_month.year, self.current_month.month
+        cal = calendar.monthcalendar(year, month)
+        for week_num, week_cells in enumerate(self._cal_cells):
+            week = cal[week_num] if week_num < len(cal) else [0] * 7
+            for day, cell in zip(week, week_cells):
                 if day == 0:
+                    cell["frame"].grid_remove()
                     continue
-                
-                frame = ctk.CTkFrame(self.grid_frame, width=100, height=80)
-                frame.grid(row=week_num+1, column=day_num, padx=2, pady=2)
-                frame.grid_propagate(False)
-                
-                ctk.CTkLabel(frame, text=str(day)).pack()
-                
-                posts = self.manager.get_scheduled_posts(self.current_month.month)
-                date_posts = [p for p in posts if p['scheduled_time'].day == day]
-                
-                if date_posts:
-                    ctk.CTkLabel(frame, 
-                               text=f"{len(date_posts)} posts",
-                               font=("Arial", 10)).pack()
+
+                n = len(self.manager.get_posts_for_day(year, month, day))
+                cell["day_lbl"].configure(text=str(day))
+                cell["count_lbl"].configure(text=f"{n} posts" if n else "")
+                cell["frame"].grid()
 
     def _change_month(self, delta):
         """Navigate between months"""
         self.current_month += relativedelta(months=delta)
         self.month_label.configure(text=self.current_month.strftime("%B %Y"))
-        self._draw_calendar()
+        self._schedule_redraw(self._draw_calendar)
+
+    def _schedule_redraw(self, redraw, *args):
+        """Run redraw once Tk is idle, coalescing repeated requests to the latest"""
+        if not self._pending_redraws:
+            self.after_idle(self._do_redraw)
+        self._pending_redraws[redraw] = args
+
+    def _do_redraw(self):
+        """Flush pending redraws"""
+        pending, self._pending_redraws = self._pending_redraws, {}
+        for redraw, args in pending.items():
+            redraw(*args)
 
     def _schedule_post(self):
         """Handle post scheduling"""
@@ -424,7 +619,9 @@ class SocialPilotApp(ctk.CTk):
             content=content,
             schedule_time=schedule_time
         )
-        self._update_status(f"Scheduled post for {platform} at {post['scheduled_time']}")
+        self._update_status(
+            f"Scheduled post for {platform} at {post['scheduled_time'].astimezone():%Y-%m-%d %H:%M}"
+        )
 
     def _parse_datetime(self):
         """Parse date and time from inputs"""
@@ -446,16 +643,33 @@ class SocialPilotApp(ctk.CTk):
     def _preview_media(self, path):
         """Preview images only"""
         try:
-            image = Image.open(path)
-            image.thumbnail((300, 300))
-            photo = ctk.CTkImage(light_image=image, dark_image=image, size=(300, 300))
+            with Image.open(path) as image:
+                # Let the JPEG decoder downscale before we resample
+                image.draft("RGB", (600, 600))
+                image.thumbnail((300, 300), Image.Resampling.BILINEAR)
+                thumb = image.copy()
+            photo = ctk.CTkImage(light_image=thumb, dark_image=thumb, size=thumb.size)
             self.media_preview.configure(image=photo)
             self.media_preview.image = photo  # Keep reference
         except Exception as e:
             self._update_status(f"Error previewing media: {str(e)}")
 
     def _run_sentiment_analysis(self):
-        """Analyze comment sentiment"""
+        """Analyze comment sentiment without blocking the UI"""
+        def worker():
+            try:
+                results = self._compute_sentiment()
+            except Exception as e:
+                self.after(0, self._update_status, f"Error analyzing sentiment: {str(e)}")
+                return
+            self.after(0, self._update_sentiment_chart, results)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _compute_sentiment(self):
+        """Count sentiment classes across comments"""
+        import pandas as pd
+
         mock_comments = [
             "Fantastic content! Keep it up! 👍",
             "This could be improved",
@@ -464,32 +678,35 @@ class SocialPilotApp(ctk.CTk):
             "Poor quality content 👎"
         ]
         
-        results = {"positive": 0, "negative": 0, "neutral": 0}
-        for comment in mock_comments:
-            sentiment = self.manager.analyze_sentiment(comment)
-            results[sentiment] += 1
-            
-        self._update_sentiment_chart(results)
+        return (
+            pd.Series(mock_comments)
+            .map(self.manager.analyze_sentiment)
+            .value_counts()
+            .reindex(["positive", "negative", "neutral"], fill_value=0)
+            .to_dict()
+        )
 
     def _update_sentiment_chart(self, data):
         """Display sentiment analysis results"""
-        fig = plt.Figure(figsize=(6, 4), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.pie(
+        if self._canvas is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            self._fig = Figure(figsize=(6, 4), dpi=100)
+            self._ax = self._fig.add_subplot(111)
+            self._canvas = FigureCanvasTkAgg(self._fig, self.chart_canvas)
+            self._canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        self._ax.clear()
+        self._ax.pie(
             data.values(),
             labels=data.keys(),
             autopct='%1.1f%%',
             colors=['#4CAF50', '#FF5252', '#FFC107'],
             startangle=90
         )
-        ax.set_title("Comment Sentiment Analysis")
-        
-        for widget in self.chart_canvas.winfo_children():
-            widget.destroy()
-            
-        canvas = FigureCanvasTkAgg(fig, self.chart_canvas)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._ax.set_title("Comment Sentiment Analysis")
+        self._canvas.draw_idle()
 
     def _generate_ai_caption(self):
         samples = [
@@ -521,34 +738,32 @@ class SocialPilotApp(ctk.CTk):
             filetypes=[("CSV Files", "*.csv")]
         )
         if path:
-            df = pd.DataFrame(self.manager.scheduled_posts)
-            df.to_csv(path, index=False)
+            fields = ["platform", "content", "media", "scheduled_time", "status"]
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(self.manager.scheduled_posts)
             self._update_status(f"Exported analytics to {path}")
 
     def _change_platform(self, platform):
-        """Handle platform change and update UI accordingly"""
+        """Handle platform change"""
+        self._schedule_redraw(self._apply_platform, platform)
+
+    def _apply_platform(self, platform):
+        """Update UI for the selected platform"""
         if hasattr(self, 'text_editor'):  
             self.text_editor.delete("1.0", "end")
         if hasattr(self, 'media_preview'):  
             self.media_preview.configure(image=None) 
         
-        char_limits = {
-            "Facebook": 2200,
-            "X (Twitter)": 280,
-            "LinkedIn": 3000,
-            "TikTok": 150,
-            "Snapchat": 100
-        }
-        limit = char_limits.get(platform, 2000)
-        if hasattr(self, 'text_editor'):
-            self.text_editor.configure(placeholder_text=f"Enter your content (max {limit} characters)...")
-
-        media_supported = platform in ["Facebook", "X (Twitter)", "Instagram", "LinkedIn"]
-        for widget in self.schedule_frame.winfo_children():
-            if isinstance(widget, ctk.CTkFrame): 
-                for child in widget.winfo_children():
-                    if isinstance(child, ctk.CTkButton) and "Add Media" in str(child.cget("text")):
-                        child.configure(state="normal" if media_supported else "disabled")
+        if hasattr(self, 'media_button'):
+            self.media_button.configure(
+                state="normal" if platform in _MEDIA_PLATFORMS else "disabled"
+            )
+
+        # CTkTextbox has no placeholder_text option, so show the limit in the status bar
+        limit = CHAR_LIMITS.get(platform, DEFAULT_CHAR_LIMIT)
+        self._update_status(f"{platform}: max {limit} characters")
 
     def run(self):
         """Start the application"""